@@ -3,30 +3,77 @@
 
 This script is used by `conf.py::setup(app)` to (re-)compile the Plotly charts
 used in the docs. It saves the HTML and WebP artefacts to the
-`docs/_static/charts` directory.
+`docs/_static/charts` directory. Charts whose inputs (i.e., the example
+script, the ridgeplot library's source code and data files, the
+`ridgeplot_examples` package, this script, and the versions of the packages
+used to export the artefacts) did not change since they were last compiled
+are skipped (see the `.manifest.json` file in the same directory).
+
+To force re-compiling all charts, either pass the `--force` flag to this
+script or set the `RIDGEPLOT_FORCE_COMPILE_CHARTS=1` environment variable
+(e.g., when building the docs).
 """
 
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata as importlib_metadata
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import plotly.graph_objects as go
 from minify_html import minify
 from plotly.offline import get_plotlyjs
 
+import ridgeplot
+import ridgeplot_examples
+from ridgeplot import __version__ as ridgeplot_version
 from ridgeplot_examples import ALL_EXAMPLES, tighten_margins
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    import plotly.graph_objects as go
-
 
 PATH_ROOT_DIR = Path(__file__).parents[2]
 PATH_DOCS = PATH_ROOT_DIR / "docs"
 PATH_STATIC_CHARTS = PATH_DOCS / "_static/charts"
 PATH_STATIC_JS = PATH_DOCS / "_static/js"
+PATH_CHARTS_MANIFEST = PATH_STATIC_CHARTS / ".manifest.json"
+PATH_EXAMPLES = Path(ridgeplot_examples.__file__).parent
+PATH_RIDGEPLOT_SRC = Path(ridgeplot.__file__).parent
+
+ARTEFACT_EXTENSIONS = ("html", "webp", "jpeg")
+
+# Upgrading any of these packages can change the compiled artefacts
+HASHED_DEPENDENCIES = ("plotly", "kaleido", "minify-html")
+
+FORCE_COMPILE_ENV_VAR = "RIDGEPLOT_FORCE_COMPILE_CHARTS"
+
+
+def force_compile_from_env() -> bool:
+    """Whether the ``RIDGEPLOT_FORCE_COMPILE_CHARTS`` environment variable
+    is set to a truthy value."""
+    return os.environ.get(FORCE_COMPILE_ENV_VAR, "").strip().lower() in {"1", "true", "yes"}
+
+
+def _copy_figure(fig: go.Figure) -> go.Figure:
+    """Return a deep copy of a Plotly figure, without re-validating it.
+
+    ``copy.deepcopy(fig)`` rebuilds the copy from ``fig.to_dict()`` and
+    re-validates every single property along the way. Since the original
+    figure has already been validated, we can skip this step when the copy
+    is only used for the image exports.
+
+    Note that an un-validated figure does not normalise the order of its
+    properties (nor ``None`` values) when serialised to JSON, so this should
+    not be used for the HTML artefacts.
+    """
+    return go.Figure(fig.to_dict(), _validate=False)
 
 
 def _to_html(fig: go.Figure, plot_id: str, minify_html: bool) -> None:
@@ -105,9 +152,72 @@ def _compile_plotly_fig(
     minify_html: bool = True,
 ) -> None:
     fig = example_loader()
-    _to_html(fig, plot_id=plot_id, minify_html=minify_html)
-    _to_webp(fig, plot_id=plot_id)
-    _to_jpeg(fig, plot_id=plot_id)
+    # Kaleido's image exports run in a separate process (releasing the GIL),
+    # so we can overlap them with the CPU-bound HTML rendering and minification.
+    # The image exports are submitted to a single worker thread, so they still
+    # run sequentially, and they get their own copy of the figure since they
+    # modify the figure's layout in-place.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fig_images = _copy_figure(fig)
+        image_exports = [
+            executor.submit(_to_webp, fig_images, plot_id=plot_id),
+            executor.submit(_to_jpeg, fig_images, plot_id=plot_id),
+        ]
+        _to_html(fig, plot_id=plot_id, minify_html=minify_html)
+        for image_export in image_exports:
+            image_export.result()
+
+
+def _iter_package_files(package_dir: Path) -> list[Path]:
+    """All files in a package directory (excluding compiled Python files)."""
+    return sorted(
+        path
+        for path in package_dir.rglob("*")
+        if path.is_file() and "__pycache__" not in path.relative_to(package_dir).parts
+    )
+
+
+def _get_shared_sources_hash() -> bytes:
+    """Hash of all inputs shared by every chart.
+
+    This includes the contents of all files in the ridgeplot library
+    (including its datasets) and in the ``ridgeplot_examples`` package (since
+    examples can import each other), this script, and the versions of the
+    ridgeplot library and of the packages used to export the artefacts.
+    Note that ridgeplot's version alone is not enough, since it does not
+    change when editing the library's code in a development (editable) install.
+    """
+    shared_hash = hashlib.blake2b(ridgeplot_version.encode())
+    for dependency in HASHED_DEPENDENCIES:
+        shared_hash.update(f"{dependency}=={importlib_metadata.version(dependency)}".encode())
+    for package_dir in (PATH_RIDGEPLOT_SRC, PATH_EXAMPLES):
+        for path in _iter_package_files(package_dir):
+            shared_hash.update(path.relative_to(package_dir).as_posix().encode())
+            shared_hash.update(hashlib.blake2b(path.read_bytes()).digest())
+    shared_hash.update(hashlib.blake2b(Path(__file__).read_bytes()).digest())
+    return shared_hash.digest()
+
+
+def _get_source_hash(plot_id: str, shared_sources_hash: bytes) -> str:
+    """Hash of all inputs used to generate a chart's artefacts.
+
+    This combines the hash of the inputs shared by all charts (see
+    :func:`_get_shared_sources_hash`) with the chart's own example script.
+    """
+    example_script = PATH_EXAMPLES / f"_{plot_id}.py"
+    return hashlib.blake2b(shared_sources_hash + example_script.read_bytes()).hexdigest()
+
+
+def _load_manifest() -> dict[str, str]:
+    if not PATH_CHARTS_MANIFEST.exists():
+        return {}
+    manifest: dict[str, str] = json.loads(PATH_CHARTS_MANIFEST.read_text("utf-8"))
+    return manifest
+
+
+def _is_up_to_date(plot_id: str, source_hash: str, manifest: dict[str, str]) -> bool:
+    artefacts = (PATH_STATIC_CHARTS / f"{plot_id}.{ext}" for ext in ARTEFACT_EXTENSIONS)
+    return manifest.get(plot_id) == source_hash and all(path.exists() for path in artefacts)
 
 
 def _write_plotlyjs_bundle() -> None:
@@ -119,16 +229,41 @@ def _write_plotlyjs_bundle() -> None:
     bundle_path.write_text(plotlyjs, encoding="utf-8")
 
 
-def compile_plotly_charts(update_plotlyjs_bundle: bool = False) -> None:
+def compile_plotly_charts(update_plotlyjs_bundle: bool = False, force: bool = False) -> None:
     if update_plotlyjs_bundle:
         _write_plotlyjs_bundle()
 
-    # Compile all charts ---
+    # Skip the charts that have not changed since they were last compiled ---
+    manifest = {} if force else _load_manifest()
+    shared_sources_hash = _get_shared_sources_hash()
+    source_hashes = {
+        plot_id: _get_source_hash(plot_id, shared_sources_hash) for plot_id, _ in ALL_EXAMPLES
+    }
+    outdated_examples = [
+        (plot_id, example_loader)
+        for plot_id, example_loader in ALL_EXAMPLES
+        if not _is_up_to_date(plot_id, source_hashes[plot_id], manifest=manifest)
+    ]
+    if not outdated_examples:
+        print("All Plotly charts are up-to-date. Skipping compilation...")
+        return
+
+    # Compile all outdated charts ---
     if not PATH_STATIC_CHARTS.exists():
         PATH_STATIC_CHARTS.mkdir(parents=True)
-    for plot_id, example_loader in ALL_EXAMPLES:
-        _compile_plotly_fig(plot_id=plot_id, example_loader=example_loader)
+    # Each chart is compiled independently and most of the time is spent
+    # in Kaleido's image export and in the HTML minification, so we can
+    # compile all charts in parallel. We use separate processes (instead
+    # of threads) since Kaleido keeps per-process global state.
+    plot_ids, example_loaders = zip(*outdated_examples)
+    max_workers = min(len(outdated_examples), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results to re-raise any errors from the workers
+        list(executor.map(_compile_plotly_fig, plot_ids, example_loaders))
+
+    manifest.update({plot_id: source_hashes[plot_id] for plot_id in plot_ids})
+    PATH_CHARTS_MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", "utf-8")
 
 
 if __name__ == "__main__":
-    compile_plotly_charts()
+    compile_plotly_charts(force="--force" in sys.argv[1:] or force_compile_from_env())
@@ -13,13 +13,13 @@ except ImportError:
     import importlib_metadata
 
 try:
-    from cicd.compile_plotly_charts import compile_plotly_charts
+    from cicd.compile_plotly_charts import compile_plotly_charts, force_compile_from_env
 except ImportError:
     # When this script is run from the readthedocs build server,
     # the `cicd` package will not be available because
     # the `cicd_utils` dir is not in the PYTHONPATH.
     sys.path.append((Path(__file__).parents[1] / "cicd_utils").resolve().as_posix())
-    from cicd.compile_plotly_charts import compile_plotly_charts
+    from cicd.compile_plotly_charts import compile_plotly_charts, force_compile_from_env
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -391,7 +391,7 @@ def _fix_html_charts(app: Sphinx, exception: Exception | None) -> None:
 
 
 def setup(app: Sphinx) -> None:
-    compile_plotly_charts()
+    compile_plotly_charts(force=force_compile_from_env())
     # app.connect("html-page-context", register_jinja_functions)
 
     app.connect("build-finished", _fix_html_charts)
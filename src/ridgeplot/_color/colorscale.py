@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 import plotly.express as px
@@ -13,7 +14,7 @@ from ridgeplot._color.utils import default_plotly_template
 from ridgeplot._types import Color, ColorScale
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Hashable
 
 
 class ColorscaleValidator(_ColorscaleValidator):
@@ -48,6 +49,18 @@ def infer_default_colorscale() -> ColorScale | Collection[Color] | str:
     )
 
 
+def _to_hashable(obj: Any) -> Hashable:
+    """Recursively convert (nested) lists into tuples."""
+    if isinstance(obj, list):
+        return tuple(map(_to_hashable, obj))  # pyright: ignore[reportUnknownArgumentType]
+    return cast("Hashable", obj)
+
+
+@lru_cache(maxsize=64)
+def _validate_coerce_colorscale_cached(colorscale: Hashable) -> ColorScale:
+    return ColorscaleValidator().validate_coerce(colorscale)
+
+
 def validate_coerce_colorscale(
     colorscale: ColorScale | Collection[Color] | str | None,
 ) -> ColorScale:
@@ -55,7 +68,14 @@ def validate_coerce_colorscale(
     :data:`ColorScale` format."""
     if colorscale is None:
         colorscale = infer_default_colorscale()
-    return ColorscaleValidator().validate_coerce(colorscale)
+    # The same colorscales tend to be validated over and over again (e.g.,
+    # when generating many figures), so we cache the coerced results. The
+    # output is an immutable tuple, so it is safe to share between callers.
+    try:
+        return _validate_coerce_colorscale_cached(_to_hashable(colorscale))
+    except TypeError:
+        # The colorscale contains unhashable objects (e.g., numpy arrays)
+        return ColorscaleValidator().validate_coerce(colorscale)
 
 
 def list_all_colorscale_names() -> list[str]:
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
 from typing_extensions import Literal, Protocol
 
 from ridgeplot._color.utils import apply_alpha, round_color, to_rgb, unpack_rgb
 from ridgeplot._types import CollectionL2, ColorScale
-from ridgeplot._utils import get_xy_extrema, normalise_min_max
-from ridgeplot._vendor.more_itertools import zip_strict
+from ridgeplot._utils import normalise_min_max, normalise_min_max_array
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    import numpy.typing as npt
 
     from ridgeplot._types import Densities, Numeric
 
@@ -60,6 +61,67 @@ def interpolate_color(colorscale: ColorScale, p: float) -> str:
     return round_color(rgb, 5)
 
 
+@lru_cache(maxsize=64)
+def _parse_colorscale(
+    colorscale: ColorScale,
+) -> tuple[npt.NDArray[np.float64], list[str], npt.NDArray[np.float64]]:
+    """Parse a colorscale into its (unique) scale values, the corresponding
+    colors in the RGB format, and an array of their RGBA channels.
+
+    Just like in :func:`interpolate_color`, only the first occurrence of
+    repeated scale values is taken into account. The results are cached, so
+    the returned objects should not be modified.
+    """
+    scale, first_idx = np.unique([s for s, _ in colorscale], return_index=True)
+    colorscale_colors = [c for _, c in colorscale]
+    colors = [to_rgb(colorscale_colors[i]) for i in first_idx]
+    rgba = np.array(
+        [(*rgb[:3], rgb[3] if len(rgb) == 4 else 1) for rgb in map(unpack_rgb, colors)],
+        dtype=np.float64,
+    )
+    scale.flags.writeable = False
+    rgba.flags.writeable = False
+    return scale, colors, rgba
+
+
+def _interpolate_colors(colorscale: ColorScale, ps: npt.NDArray[np.float64]) -> list[str]:
+    """Vectorized version of :func:`interpolate_color` over an array of
+    interpolation points.
+
+    Each colorscale segment is found with a single binary search over the
+    scale values, and the color channels of all points are then mixed at once.
+    The returned colors are exactly the same as the ones returned by calling
+    :func:`interpolate_color` on each point individually.
+    """
+    # NaN values should also be rejected (just like in interpolate_color())
+    out_of_bounds = ~((ps >= 0) & (ps <= 1))
+    if out_of_bounds.any():
+        raise ValueError(
+            "The interpolation point 'p' should be a float value between 0 and 1, "
+            f"not {ps[out_of_bounds][0]}."
+        )
+    try:
+        scale, colors, rgba = _parse_colorscale(tuple(colorscale))
+    except TypeError:
+        # Unhashable colorscale entries (e.g., a list of lists)
+        scale, colors, rgba = _parse_colorscale.__wrapped__(colorscale)
+
+    idx = np.searchsorted(scale, ps)
+    is_stop = scale[np.minimum(idx, len(scale) - 1)] == ps
+    fill_colors = [colors[i] for i in np.minimum(idx, len(scale) - 1)]
+
+    ith_mixed = np.flatnonzero(~is_stop)
+    ceil = idx[ith_mixed]
+    floor = ceil - 1
+    p_norm = (ps[ith_mixed] - scale[floor]) / (scale[ceil] - scale[floor])
+    mixed = rgba[floor] + (p_norm[:, None] * (rgba[ceil] - rgba[floor]))
+    for i, (r, g, b, alpha) in zip(ith_mixed, mixed.tolist()):
+        # Rounding to the same precision used in interpolate_color()
+        rgb = f"{round(r, 5)}, {round(g, 5)}, {round(b, 5)}"
+        fill_colors[i] = f"rgba({rgb}, {round(alpha, 5)})" if alpha < 1 else f"rgb({rgb})"
+    return fill_colors
+
+
 def slice_colorscale(
     colorscale: ColorScale,
     p_lower: float,
@@ -123,9 +185,32 @@ Example
 """
 
 
-@dataclass
+def _weighted_means(
+    xs: npt.NDArray[np.float64],
+    ys: npt.NDArray[np.float64],
+    trace_ptr: npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    """Compute the y-weighted mean of the x-values of each (flattened) trace."""
+    starts = trace_ptr[:-1]
+    weights = np.add.reduceat(ys, starts)
+    if (weights == 0).any():
+        raise ValueError(
+            "Cannot compute the mean of a trace whose y-values sum to zero "
+            f"(trace index: {np.flatnonzero(weights == 0)[0]})."
+        )
+    return np.add.reduceat(xs * ys, starts) / weights
+
+
+@dataclass(frozen=True, eq=False)
 class InterpolationContext:
-    """Context information needed by the interpolation functions."""
+    """Context information needed by the interpolation functions.
+
+    Use :meth:`from_densities` to build a new context. All fields are derived
+    from a single pass over the ``densities`` array.
+
+    Since some fields are NumPy arrays, contexts are compared (and hashed) by
+    identity rather than by value.
+    """
 
     densities: Densities
     n_rows: int
@@ -133,86 +218,102 @@ class InterpolationContext:
     x_min: Numeric
     x_max: Numeric
 
+    # Flat (x, y) coordinates of all traces, where the points of the i-th
+    # trace are stored between `trace_ptr[i]` and `trace_ptr[i + 1]`
+    xs_flat: npt.NDArray[np.float64] = field(repr=False)
+    ys_flat: npt.NDArray[np.float64] = field(repr=False)
+    trace_ptr: npt.NDArray[np.intp] = field(repr=False)
+
+    # Trace offsets of each row, where the traces of the i-th row
+    # are the ones between `row_ptr[i]` and `row_ptr[i + 1]`
+    row_ptr: npt.NDArray[np.intp] = field(repr=False)
+
     @classmethod
     def from_densities(cls, densities: Densities) -> InterpolationContext:
-        x_min, x_max, _, _ = get_xy_extrema(densities=densities)
+        if len(densities) == 0:
+            raise ValueError("The densities array should not be empty.")
+        traces = [np.asarray(trace, dtype=np.float64) for row in densities for trace in row]
+        for trace in traces:
+            if trace.ndim != 2 or trace.shape[1] != 2:
+                raise ValueError(
+                    "Each density trace should be a sequence of (x, y) points, "
+                    f"got an array of shape {trace.shape} instead."
+                )
+        xy_flat = np.concatenate(traces)
+        xs_flat = np.ascontiguousarray(xy_flat[:, 0])
+        ys_flat = np.ascontiguousarray(xy_flat[:, 1])
+        trace_ptr = np.cumsum([0, *map(len, traces)])
         return cls(
             densities=densities,
             n_rows=len(densities),
-            n_traces=sum(len(row) for row in densities),
-            x_min=x_min,
-            x_max=x_max,
+            n_traces=len(traces),
+            x_min=float(xs_flat.min()),
+            x_max=float(xs_flat.max()),
+            xs_flat=xs_flat,
+            ys_flat=ys_flat,
+            trace_ptr=trace_ptr,
+            row_ptr=np.cumsum([0, *map(len, densities)]),
         )
 
+    @cached_property
+    def trace_means(self) -> npt.NDArray[np.float64]:
+        """The y-weighted mean of the x-values of each trace.
+
+        This is only needed by the mean-based colormodes, so it is only
+        computed (once) when first accessed.
+        """
+        return _weighted_means(self.xs_flat, self.ys_flat, self.trace_ptr)
+
 
 class InterpolationFunc(Protocol):
     def __call__(self, ctx: InterpolationContext) -> ColorscaleInterpolants: ...
 
 
-def _mul(a: tuple[Numeric, ...], b: tuple[Numeric, ...]) -> tuple[Numeric, ...]:
-    """Multiply two tuples element-wise."""
-    return tuple(a_i * b_i for a_i, b_i in zip_strict(a, b))
+def _split_rows(ctx: InterpolationContext, values: npt.NDArray[np.float64]) -> list[list[float]]:
+    """Split a flat array of per-trace values back into the ragged rows."""
+    return [values[start:end].tolist() for start, end in zip(ctx.row_ptr[:-1], ctx.row_ptr[1:])]
 
 
 def _interpolate_row_index(ctx: InterpolationContext) -> ColorscaleInterpolants:
     if ctx.n_rows == 1:
         return [[0.0] * ctx.n_traces]
-    return [
-        [((ctx.n_rows - 1) - ith_row) / (ctx.n_rows - 1)] * len(row)
-        for ith_row, row in enumerate(ctx.densities)
-    ]
+    ps_rows = ((ctx.n_rows - 1) - np.arange(ctx.n_rows)) / (ctx.n_rows - 1)
+    return _split_rows(ctx, np.repeat(ps_rows, np.diff(ctx.row_ptr)))
 
 
 def _interpolate_trace_index(ctx: InterpolationContext) -> ColorscaleInterpolants:
     if ctx.n_traces == 1:
         return [[0.0]]
-    ps = []
-    ith_trace = 0
-    for row in ctx.densities:
-        ps_row = []
-        for _ in row:
-            ps_row.append(((ctx.n_traces - 1) - ith_trace) / (ctx.n_traces - 1))
-            ith_trace += 1
-        ps.append(ps_row)
-    return ps
+    return _split_rows(ctx, ((ctx.n_traces - 1) - np.arange(ctx.n_traces)) / (ctx.n_traces - 1))
 
 
 def _interpolate_trace_index_row_wise(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    return [
-        [
-            ((len(row) - 1) - ith_row_trace) / (len(row) - 1) if len(row) > 1 else 0.0
-            for ith_row_trace in range(len(row))
-        ]
-        for row in ctx.densities
-    ]
+    row_lens = np.diff(ctx.row_ptr)
+    # The length of the row that each trace belongs to,
+    # and the index of each trace within its own row
+    trace_row_lens = np.repeat(row_lens, row_lens)
+    ith_row_trace = np.arange(ctx.n_traces) - np.repeat(ctx.row_ptr[:-1], row_lens)
+    ps = np.where(
+        trace_row_lens > 1,
+        ((trace_row_lens - 1) - ith_row_trace) / np.maximum(trace_row_lens - 1, 1),
+        0.0,
+    )
+    return _split_rows(ctx, ps)
 
 
 def _interpolate_mean_minmax(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    ps = []
-    for row in ctx.densities:
-        ps_row = []
-        for trace in row:
-            x, y = zip(*trace)
-            ps_row.append(
-                normalise_min_max(sum(_mul(x, y)) / sum(y), min_=ctx.x_min, max_=ctx.x_max)
-            )
-        ps.append(ps_row)
-    return ps
+    return _split_rows(
+        ctx, normalise_min_max_array(ctx.trace_means, min_=ctx.x_min, max_=ctx.x_max)
+    )
 
 
 def _interpolate_mean_means(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    means = []
-    for row in ctx.densities:
-        means_row = []
-        for trace in row:
-            x, y = zip(*trace)
-            means_row.append(sum(_mul(x, y)) / sum(y))
-        means.append(means_row)
-    min_mean = min(min(row) for row in means)
-    max_mean = max(max(row) for row in means)
-    return [
-        [normalise_min_max(mean, min_=min_mean, max_=max_mean) for mean in row] for row in means
-    ]
+    return _split_rows(
+        ctx,
+        normalise_min_max_array(
+            ctx.trace_means, min_=ctx.trace_means.min(), max_=ctx.trace_means.max()
+        ),
+    )
 
 
 SolidColormode = Literal[
@@ -235,19 +336,26 @@ SOLID_COLORMODE_MAPS: dict[SolidColormode, InterpolationFunc] = {
 
 def compute_solid_colors(
     colorscale: ColorScale,
-    colormode: SolidColormode,
+    interpolate_func: InterpolationFunc,
     opacity: float | None,
     interpolation_ctx: InterpolationContext,
-) -> Generator[Generator[str]]:
-    """Compute the solid colors for all traces in the plot."""
+) -> list[list[str]]:
+    """Compute the solid colors for all traces in the plot.
 
-    def get_fill_color(p: float) -> str:
-        fill_color = interpolate_color(colorscale, p=p)
-        if opacity is not None:
-            # Sometimes the interpolation logic can drop the alpha channel
-            fill_color = apply_alpha(fill_color, alpha=float(opacity))
-        return fill_color
-
-    interpolate_func = SOLID_COLORMODE_MAPS[colormode]
+    The ``interpolate_func`` should be resolved from the solid colormode
+    upfront (see :data:`SOLID_COLORMODE_MAPS`).
+    """
     interpolants = interpolate_func(ctx=interpolation_ctx)
-    return ((get_fill_color(p) for p in row) for row in interpolants)
+    # Many traces share the same interpolation point (e.g., all traces in the
+    # same row when colormode='row-index'), so we only need to compute the
+    # colors for the unique interpolation points
+    ps_unique, inverse = np.unique(
+        np.fromiter((p for row in interpolants for p in row), dtype=np.float64),
+        return_inverse=True,
+    )
+    colors_unique = _interpolate_colors(colorscale, ps=ps_unique)
+    if opacity is not None:
+        # Sometimes the interpolation logic can drop the alpha channel
+        colors_unique = [apply_alpha(c, alpha=float(opacity)) for c in colors_unique]
+    fill_colors = iter([colors_unique[i] for i in inverse])
+    return [[next(fill_colors) for _ in row] for row in interpolants]
@@ -9,6 +9,7 @@ from typing_extensions import Literal
 
 from ridgeplot._color.colorscale import validate_coerce_colorscale
 from ridgeplot._color.interpolation import (
+    SOLID_COLORMODE_MAPS,
     InterpolationContext,
     SolidColormode,
     compute_solid_colors,
@@ -31,7 +32,6 @@ from ridgeplot._types import (
 )
 from ridgeplot._utils import (
     get_collection_array_shape,
-    get_xy_extrema,
     normalise_row_attrs,
     ordered_dedup,
 )
@@ -139,9 +139,10 @@ def create_ridgeplot(
     if len(shape) != 4:
         raise ValueError(f"Expected a 4D array of densities, got a {len(shape)}D array instead.")
 
-    n_rows = len(densities)
-    n_traces = sum(len(row) for row in densities)
-    x_min, x_max, _, y_max = map(float, get_xy_extrema(densities=densities))
+    interpolation_ctx = InterpolationContext.from_densities(densities)
+    n_traces = interpolation_ctx.n_traces
+    x_min, x_max = float(interpolation_ctx.x_min), float(interpolation_ctx.x_max)
+    y_max = float(interpolation_ctx.ys_flat.max())
 
     trace_types = normalise_trace_types(
         densities=densities,
@@ -161,20 +162,23 @@ def create_ridgeplot(
     xpad = float(xpad)
     colorscale = validate_coerce_colorscale(colorscale)
 
+    # The solid colors (also used for the "fill-color" line color when
+    # colormode="fillgradient") are computed using the "mean-minmax" mode
+    solid_colormode = colormode if colormode != "fillgradient" else "mean-minmax"
+    if solid_colormode not in SOLID_COLORMODE_MAPS:
+        raise ValueError(
+            f"Invalid colormode {colormode!r}, expected 'fillgradient' or one of: "
+            f"{', '.join(map(repr, SOLID_COLORMODE_MAPS))}"
+        )
+    interpolate_func = SOLID_COLORMODE_MAPS[solid_colormode]
+
     # ==============================================================
     # ---  Build the figure
     # ==============================================================
 
-    interpolation_ctx = InterpolationContext(
-        densities=densities,
-        n_rows=n_rows,
-        n_traces=n_traces,
-        x_min=x_min,
-        x_max=x_max,
-    )
     solid_colors = compute_solid_colors(
         colorscale=colorscale,
-        colormode=colormode if colormode != "fillgradient" else "mean-minmax",
+        interpolate_func=interpolate_func,
         opacity=opacity,
         interpolation_ctx=interpolation_ctx,
     )
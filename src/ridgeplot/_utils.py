@@ -10,66 +10,44 @@ from typing_extensions import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
     from typing_extensions import Any
 
     from ridgeplot._types import CollectionL2, Densities, NormalisationOption, Numeric
 
 
-def get_xy_extrema(densities: Densities) -> tuple[Numeric, Numeric, Numeric, Numeric]:
-    r"""Get the global x-y extrema (x_min, x_max, y_min, y_max) over all
-    :data:`~ridgeplot._types.DensityTrace`\s in the
-    :data:`~ridgeplot._types.Densities` array.
-
-    Parameters
-    ----------
-    densities
-        A :data:`~ridgeplot._types.Densities` array.
+def _validate_min_max_range(min_: Numeric, max_: Numeric) -> None:
+    if max_ <= min_:
+        raise ValueError(
+            f"max_ should be greater than min_. Got max_={max_} and min_={min_} instead."
+        )
 
 
-    Returns
-    -------
-    Tuple[Numeric, Numeric, Numeric, Numeric]
-        A tuple of the form (x_min, x_max, y_min, y_max).
-
-    Examples
-    --------
-    >>> get_xy_extrema(
-    ...     [
-    ...         [
-    ...             [(0, 0), (1, 1), (2, 2), (3, 3)],
-    ...             [(0, 0), (1, 1), (2, 2)],
-    ...             [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)],
-    ...         ],
-    ...         [
-    ...             [(-2, 2), (-1, 1), (0, 1)],
-    ...             [(2, 2), (3, 1), (4, 1)],
-    ...         ],
-    ...     ]
-    ... )
-    (-2, 4, 0, 4)
-    """
-    if len(densities) == 0:
-        raise ValueError("The densities array should not be empty.")
-    x_flat: list[Numeric] = []
-    y_flat: list[Numeric] = []
-    for row in densities:
-        for trace in row:
-            for x, y in trace:
-                x_flat.append(x)
-                y_flat.append(y)
-    return min(x_flat), max(x_flat), min(y_flat), max(y_flat)
+def _out_of_bounds_error(val: Numeric, min_: Numeric, max_: Numeric) -> ValueError:
+    return ValueError(f"val ({val}) is out of bounds ({min_}, {max_}).")
 
 
 def normalise_min_max(val: Numeric, min_: Numeric, max_: Numeric) -> float:
-    if max_ <= min_:
-        raise ValueError(
-            f"max_ should be greater than min_. Got max_={max_} and min_={min_} instead."
-        )
+    _validate_min_max_range(min_=min_, max_=max_)
     if not (min_ <= val <= max_):
-        raise ValueError(f"val ({val}) is out of bounds ({min_}, {max_}).")
+        raise _out_of_bounds_error(val, min_=min_, max_=max_)
     return float((val - min_) / (max_ - min_))
 
 
+def normalise_min_max_array(
+    values: npt.NDArray[np.float64], min_: Numeric, max_: Numeric
+) -> npt.NDArray[np.float64]:
+    """Vectorized version of :func:`normalise_min_max`."""
+    _validate_min_max_range(min_=min_, max_=max_)
+    # Written as a negation so that NaN values are also rejected
+    # (just like `not (min_ <= val <= max_)` in normalise_min_max())
+    out_of_bounds = ~((values >= min_) & (values <= max_))
+    if out_of_bounds.any():
+        raise _out_of_bounds_error(values[out_of_bounds][0], min_=min_, max_=max_)
+    return (values - min_) / (max_ - min_)
+
+
 def get_collection_array_shape(arr: Collection[Any]) -> tuple[int | set[int], ...]:
     """Return the shape of a :class:`~typing.Collection` array.
 
@@ -1,6 +1,34 @@
 from __future__ import annotations
 
-from cicd.compile_plotly_charts import PATH_DOCS
+import importlib.metadata
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+import cicd.compile_plotly_charts as cpc
+from cicd.compile_plotly_charts import (
+    ARTEFACT_EXTENSIONS,
+    FORCE_COMPILE_ENV_VAR,
+    PATH_DOCS,
+    PATH_EXAMPLES,
+    _get_shared_sources_hash,  # pyright: ignore[reportPrivateUsage]
+    _get_source_hash,  # pyright: ignore[reportPrivateUsage]
+    _is_up_to_date,  # pyright: ignore[reportPrivateUsage]
+    compile_plotly_charts,
+    force_compile_from_env,
+)
+from ridgeplot_examples import ALL_EXAMPLES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    import plotly.graph_objects as go
+
+ALL_PLOT_IDS = [plot_id for plot_id, _ in ALL_EXAMPLES]
 
 
 def test_path_docs_exists() -> None:
@@ -8,3 +36,203 @@ def test_path_docs_exists() -> None:
     assert PATH_DOCS.is_dir()
     assert PATH_DOCS.name == "docs"
     assert (PATH_DOCS / "conf.py").exists()
+
+
+def _get_source_hashes() -> dict[str, str]:
+    shared_sources_hash = _get_shared_sources_hash()
+    return {plot_id: _get_source_hash(plot_id, shared_sources_hash) for plot_id in ALL_PLOT_IDS}
+
+
+def test_get_source_hash() -> None:
+    for plot_id, _ in ALL_EXAMPLES:
+        assert (PATH_EXAMPLES / f"_{plot_id}.py").exists()
+    source_hashes = _get_source_hashes()
+    assert _get_source_hashes() == source_hashes
+    assert len(set(source_hashes.values())) == len(ALL_EXAMPLES)
+
+
+def test_get_shared_sources_hash_changes_with_dependency_versions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    shared_sources_hash = _get_shared_sources_hash()
+    real_version = importlib.metadata.version
+    monkeypatch.setattr(
+        importlib.metadata,
+        "version",
+        lambda name: "0.0.0" if name == "kaleido" else real_version(name),
+    )
+    assert _get_shared_sources_hash() != shared_sources_hash
+
+
+def test_get_source_hash_changes_with_library_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src_dir = tmp_path / "ridgeplot"
+    (src_dir / "datasets").mkdir(parents=True)
+    (src_dir / "__init__.py").write_text("x = 1\n")
+    (src_dir / "datasets" / "data.csv").write_text("a,b\n")
+    monkeypatch.setattr(cpc, "PATH_RIDGEPLOT_SRC", src_dir)
+
+    source_hashes = _get_source_hashes()
+    # Compiled files should be ignored
+    (src_dir / "__pycache__").mkdir()
+    (src_dir / "__pycache__" / "__init__.cpython-311.pyc").write_bytes(b"...")
+    assert _get_source_hashes() == source_hashes
+
+    (src_dir / "__init__.py").write_text("x = 2\n")
+    new_source_hashes = _get_source_hashes()
+    assert all(new_source_hashes[i] != source_hashes[i] for i in ALL_PLOT_IDS)
+    source_hashes = new_source_hashes
+    (src_dir / "datasets" / "data.csv").write_text("a,b\n1,2\n")
+    new_source_hashes = _get_source_hashes()
+    assert all(new_source_hashes[i] != source_hashes[i] for i in ALL_PLOT_IDS)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1", True), ("true", True), (" Yes ", True), ("", False), ("0", False), ("no", False)],
+)
+def test_force_compile_from_env(
+    value: str, expected: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(FORCE_COMPILE_ENV_VAR, value)
+    assert force_compile_from_env() is expected
+
+
+def test_force_compile_from_env_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(FORCE_COMPILE_ENV_VAR, raising=False)
+    assert force_compile_from_env() is False
+
+
+# ==============================================================
+# ---  compile_plotly_charts() (with stubbed chart compilation)
+# ==============================================================
+
+
+@pytest.fixture
+def charts_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    charts_dir = tmp_path / "charts"
+    monkeypatch.setattr(cpc, "PATH_STATIC_CHARTS", charts_dir)
+    monkeypatch.setattr(cpc, "PATH_CHARTS_MANIFEST", charts_dir / ".manifest.json")
+    # The stubbed compilation function can't be pickled,
+    # so we run the "workers" in threads instead
+    monkeypatch.setattr(cpc, "ProcessPoolExecutor", ThreadPoolExecutor)
+    return charts_dir
+
+
+@pytest.fixture
+def compiled(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Stub out :func:`_compile_plotly_fig` and record the compiled plot IDs."""
+    compiled: list[str] = []
+
+    def _compile_plotly_fig_stub(plot_id: str, _example_loader: Callable[[], go.Figure]) -> None:
+        compiled.append(plot_id)
+        for ext in ARTEFACT_EXTENSIONS:
+            (cpc.PATH_STATIC_CHARTS / f"{plot_id}.{ext}").write_text("...")
+
+    monkeypatch.setattr(cpc, "_compile_plotly_fig", _compile_plotly_fig_stub)
+    return compiled
+
+
+def _read_manifest(charts_dir: Path) -> dict[str, str]:
+    manifest: dict[str, str] = json.loads((charts_dir / ".manifest.json").read_text())
+    return manifest
+
+
+def test_is_up_to_date(charts_dir: Path) -> None:
+    charts_dir.mkdir()
+    plot_id = ALL_PLOT_IDS[0]
+    manifest = {plot_id: "abc"}
+    # No artefacts
+    assert not _is_up_to_date(plot_id, "abc", manifest=manifest)
+    for ext in ARTEFACT_EXTENSIONS:
+        (charts_dir / f"{plot_id}.{ext}").write_text("...")
+    assert _is_up_to_date(plot_id, "abc", manifest=manifest)
+    # Outdated (or missing) source hash
+    assert not _is_up_to_date(plot_id, "def", manifest=manifest)
+    assert not _is_up_to_date(plot_id, "abc", manifest={})
+    # Missing artefact
+    (charts_dir / f"{plot_id}.webp").unlink()
+    assert not _is_up_to_date(plot_id, "abc", manifest=manifest)
+
+
+def test_compile_plotly_charts_skips_up_to_date_charts(
+    charts_dir: Path, compiled: list[str]
+) -> None:
+    compile_plotly_charts()
+    assert sorted(compiled) == sorted(ALL_PLOT_IDS)
+    assert _read_manifest(charts_dir) == _get_source_hashes()
+
+    compiled.clear()
+    compile_plotly_charts()
+    assert compiled == []
+
+
+def test_compile_plotly_charts_missing_artefact(charts_dir: Path, compiled: list[str]) -> None:
+    compile_plotly_charts()
+    compiled.clear()
+    plot_id = ALL_PLOT_IDS[-1]
+    (charts_dir / f"{plot_id}.jpeg").unlink()
+    compile_plotly_charts()
+    assert compiled == [plot_id]
+
+
+def test_compile_plotly_charts_outdated_hash(charts_dir: Path, compiled: list[str]) -> None:
+    compile_plotly_charts()
+    compiled.clear()
+    plot_id = ALL_PLOT_IDS[0]
+    manifest = _read_manifest(charts_dir)
+    manifest[plot_id] = "outdated"
+    (charts_dir / ".manifest.json").write_text(json.dumps(manifest))
+    compile_plotly_charts()
+    assert compiled == [plot_id]
+    assert _read_manifest(charts_dir)[plot_id] == _get_source_hashes()[plot_id]
+
+
+def test_compile_plotly_charts_indirect_example_import(
+    tmp_path: Path, charts_dir: Path, compiled: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Examples can import other example modules (e.g., 'lincoln_weather_red_blue'
+    imports 'lincoln_weather'), so editing any module should rebuild them."""
+    assert (
+        "from ridgeplot_examples._lincoln_weather import"
+        in (PATH_EXAMPLES / "_lincoln_weather_red_blue.py").read_text()
+    )
+    examples_dir = tmp_path / "ridgeplot_examples"
+    shutil.copytree(PATH_EXAMPLES, examples_dir)
+    monkeypatch.setattr(cpc, "PATH_EXAMPLES", examples_dir)
+    compile_plotly_charts()
+    compiled.clear()
+
+    with (examples_dir / "_lincoln_weather.py").open("a") as f:
+        f.write("\n# Edited\n")
+    compile_plotly_charts()
+    assert "lincoln_weather_red_blue" in compiled
+    assert _read_manifest(charts_dir) == _get_source_hashes()
+
+
+@pytest.mark.usefixtures("charts_dir")
+def test_compile_plotly_charts_force(compiled: list[str]) -> None:
+    compile_plotly_charts()
+    compiled.clear()
+    compile_plotly_charts(force=True)
+    assert sorted(compiled) == sorted(ALL_PLOT_IDS)
+
+
+@pytest.mark.usefixtures("compiled")
+def test_compile_plotly_charts_worker_failure(
+    charts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    compile_plotly_charts_stub = cpc._compile_plotly_fig  # pyright: ignore[reportPrivateUsage]
+    failing_plot_id = ALL_PLOT_IDS[-1]
+
+    def _compile_plotly_fig_failing(plot_id: str, example_loader: Callable[[], go.Figure]) -> None:
+        if plot_id == failing_plot_id:
+            raise RuntimeError("Kaleido failed!")
+        compile_plotly_charts_stub(plot_id, example_loader)
+
+    monkeypatch.setattr(cpc, "_compile_plotly_fig", _compile_plotly_fig_failing)
+    with pytest.raises(RuntimeError, match="Kaleido failed!"):
+        compile_plotly_charts()
+    # The manifest should only be written after all charts compiled successfully
+    assert not (charts_dir / ".manifest.json").exists()
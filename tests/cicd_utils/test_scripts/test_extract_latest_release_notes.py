@@ -12,6 +12,8 @@ from cicd.scripts.extract_latest_release_notes import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from markdown_it.token import Token
 
 
@@ -79,15 +81,50 @@ def test_extract_latest_release_notes(
     assert text == expected_latest_notes
 
 
-def test_myst_roles() -> None:
-    whitelisted_roles = {"gh-pr", "gh-issue", "gh-user"}
+def _iter_myst_roles(tokens: list[Token]) -> Iterator[Token]:
+    """Lazily yield all myst role tokens in a markdown token tree.
+
+    The tree is walked with an explicit stack (instead of recursion) to avoid
+    hitting the recursion limit on deeply nested changelogs.
+    """
+    # Tokens are pushed in reverse order so that they are popped
+    # (and yielded) in document order
+    stack = list(reversed(tokens))
+    while stack:
+        token = stack.pop()
+        if token.children:
+            stack.extend(reversed(token.children))
+        if token.type == "myst_role":
+            yield token
+
+
+def test_iter_myst_roles_document_order() -> None:
+    tokens = parse_markdown_tokens(
+        "- {gh-pr}`1` and {gh-issue}`2`\n"
+        "  - Nested {gh-user}`user`\n"
+        "\n"
+        "Some text with {foo}`3` and {bar}`4`\n"
+    )
+    roles = [(token.meta["name"], token.content) for token in _iter_myst_roles(tokens)]
+    assert roles == [
+        ("gh-pr", "1"),
+        ("gh-issue", "2"),
+        ("gh-user", "user"),
+        ("foo", "3"),
+        ("bar", "4"),
+    ]
 
-    def validate_tokens(tkns: list[Token]) -> None:
-        for token in tkns:
-            if token.children:
-                validate_tokens(token.children)
-            if token.type == "myst_role" and token.meta.get("name", "") not in whitelisted_roles:
-                raise ValueError(f"Unexpected myst role: {token.meta}")
 
+def test_myst_roles() -> None:
+    whitelisted_roles = {"gh-pr", "gh-issue", "gh-user"}
     tokens = parse_markdown_tokens(PATH_TO_CHANGELOG.read_text())
-    validate_tokens(tokens)
+    unexpected_role = next(
+        (
+            token
+            for token in _iter_myst_roles(tokens)
+            if token.meta.get("name", "") not in whitelisted_roles
+        ),
+        None,
+    )
+    if unexpected_role is not None:
+        pytest.fail(f"Unexpected myst role: {unexpected_role.meta}")
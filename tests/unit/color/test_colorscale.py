@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from ridgeplot._color.colorscale import (
@@ -51,6 +52,15 @@ def test_validate_coerce_colorscale_fails(
         validate_coerce_colorscale(invalid_colorscale)
 
 
+def test_validate_coerce_colorscale_cached() -> None:
+    colors = ["red", "green", "blue"]
+    coerced = validate_coerce_colorscale(colors)
+    # Equal (but distinct) list inputs should hit the cache
+    assert validate_coerce_colorscale(list(colors)) is coerced
+    # Unhashable inputs should still be supported
+    assert validate_coerce_colorscale(np.array(colors)) == coerced
+
+
 # ==============================================================
 # --- list_all_colorscale_names()
 # ==============================================================
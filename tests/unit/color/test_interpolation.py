@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from itertools import product
+from typing import TYPE_CHECKING, TypeVar, cast
 
+import numpy as np
 import pytest
 
 from ridgeplot import ridgeplot
@@ -10,15 +12,29 @@ from ridgeplot._color.interpolation import (
     ColorscaleInterpolants,
     InterpolationContext,
     SolidColormode,
+    _interpolate_colors,  # pyright: ignore[reportPrivateUsage]
     _interpolate_mean_means,  # pyright: ignore[reportPrivateUsage]
     _interpolate_mean_minmax,  # pyright: ignore[reportPrivateUsage]
+    _interpolate_row_index,  # pyright: ignore[reportPrivateUsage]
+    _parse_colorscale,  # pyright: ignore[reportPrivateUsage]
     interpolate_color,
     slice_colorscale,
 )
 from ridgeplot._color.utils import to_rgb
 
 if TYPE_CHECKING:
-    from ridgeplot._types import ColorScale, Densities
+    from collections.abc import Callable
+
+    from typing_extensions import Literal
+
+    from ridgeplot._types import ColorScale, Densities, DensitiesRow
+
+_X = TypeVar("_X")
+
+
+def id_func(x: _X) -> _X:
+    """Identity function."""
+    return x
 
 
 # ==============================================================
@@ -52,6 +68,54 @@ def test_interpolate_color_fails_for_p_out_of_bounds(p: float) -> None:
         interpolate_color(colorscale=..., p=p)
 
 
+# ==============================================================
+# ---  _interpolate_colors()
+# ==============================================================
+
+
+@pytest.mark.parametrize(
+    "colorscale",
+    [
+        ((0, "rgb(68, 1, 84)"), (0.5, "rgb(33, 145, 140)"), (1, "rgb(253, 231, 37)")),
+        ((0, "rgba(0, 0, 0, 0)"), (1, "rgba(255, 255, 255, 1)")),
+        # Repeated scale values (i.e., "hard" color stops)
+        ((0, "red"), (0.5, "green"), (0.5, "#0000ff"), (1, "rgb(1, 2, 3)")),
+    ],
+)
+def test_interpolate_colors_matches_interpolate_color(colorscale: ColorScale) -> None:
+    ps = np.array([0, 0.1, 1 / 3, 0.5, 0.75, 0.999, 1])
+    expected = [interpolate_color(colorscale=colorscale, p=p) for p in ps]
+    assert _interpolate_colors(colorscale=colorscale, ps=ps) == expected
+
+
+def test_interpolate_colors_fails_for_p_out_of_bounds() -> None:
+    with pytest.raises(ValueError, match=r"should be a float value between 0 and 1, not 1\.1"):
+        _interpolate_colors(colorscale=((0, "red"), (1, "blue")), ps=np.array([0.5, 1.1]))
+    with pytest.raises(ValueError, match=r"should be a float value between 0 and 1, not nan"):
+        _interpolate_colors(colorscale=((0, "red"), (1, "blue")), ps=np.array([0.5, np.nan]))
+
+
+def test_interpolate_colors_unhashable_colorscale() -> None:
+    ps = np.array([0, 0.5, 1])
+    expected = ["rgb(255, 0, 0)", "rgb(127.5, 0.0, 127.5)", "rgb(0, 0, 255)"]
+    # Colorscales are usually tuples (after validation), but lists
+    # of lists (which are not hashable) should also be supported
+    colorscale = cast("ColorScale", [[0, "red"], [1, "blue"]])
+    assert _interpolate_colors(colorscale=colorscale, ps=ps) == expected
+
+
+def test_parse_colorscale() -> None:
+    cs = ((0, "red"), (0.5, "green"), (0.5, "blue"), (1, "rgba(1, 2, 3, 0.5)"))
+    scale, colors, rgba = _parse_colorscale(cs)
+    assert scale.tolist() == [0, 0.5, 1]
+    assert colors == ["rgb(255, 0, 0)", "rgb(0, 128, 0)", "rgba(1, 2, 3, 0.5)"]
+    assert rgba.tolist() == [[255, 0, 0, 1], [0, 128, 0, 1], [1, 2, 3, 0.5]]
+    # The parsed arrays are cached and shared, so they should be read-only
+    assert _parse_colorscale(cs)[0] is scale
+    assert not scale.flags.writeable
+    assert not rgba.flags.writeable
+
+
 # ==============================================================
 # --- slice_colorscale()
 # ==============================================================
@@ -166,6 +230,99 @@ def test_interpolate_mean_means() -> None:
     assert ps == [[0.0], [0.5], [1.0]]
 
 
+def test_interpolate_mean_means_fails_for_equal_means() -> None:
+    ctx = InterpolationContext.from_densities([[[(0, 1), (1, 2), (2, 1)], [(0, 1), (2, 1)]]])
+    with pytest.raises(ValueError, match="max_ should be greater than min_"):
+        _interpolate_mean_means(ctx)
+
+
+def test_interpolation_context_raises_for_empty_densities() -> None:
+    with pytest.raises(ValueError, match="The densities array should not be empty"):
+        InterpolationContext.from_densities([])
+
+
+def test_interpolation_context_raises_for_non_2d_traces() -> None:
+    with pytest.raises(ValueError, match=r"sequence of \(x, y\) points, got .* shape \(2, 3\)"):
+        InterpolationContext.from_densities(
+            [
+                # valid 2D trace
+                [[(0, 0), (1, 1), (2, 2)]],
+                # invalid 3D trace
+                [[(3, 3, 3), (4, 4, 4)]],  # pyright: ignore[reportArgumentType]
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    ("densities_type", "rows_type"),
+    product((id_func, tuple, list), (id_func, tuple, list, np.asarray)),
+)
+def test_interpolation_context_from_densities(
+    densities_type: Callable[[Densities], Densities],
+    rows_type: Callable[[DensitiesRow], DensitiesRow],
+) -> None:
+    """Test :meth:`InterpolationContext.from_densities()` against a varied
+    combination of possible input types."""
+    densities: Densities = [
+        (
+            [
+                (1, 1),  # x_min -> 1
+                (2, 2),
+                (3, 3),
+                (4, 4),
+            ],
+        ),
+        [
+            (
+                (2, 2),
+                (36, 3),  # x_max -> 36
+                (4, 62),
+            )
+        ],
+        np.asarray(
+            [
+                [
+                    (2, 0),
+                    (3, 1),
+                ]
+            ]
+        ),
+    ]
+    densities = densities_type([rows_type(row) for row in densities])
+    ctx = InterpolationContext.from_densities(densities)
+    assert (ctx.n_rows, ctx.n_traces) == (3, 3)
+    assert (ctx.x_min, ctx.x_max) == (1, 36)
+    assert ctx.row_ptr.tolist() == [0, 1, 2, 3]
+    assert ctx.trace_ptr.tolist() == [0, 4, 7, 9]
+
+
+def test_interpolation_context_zero_mass_trace() -> None:
+    """The trace means are only computed when needed by a mean-based colormode."""
+    densities = [[[(0, 0), (1, 0), (2, 0)]], [[(0, 1), (1, 2), (2, 1)]]]
+    ctx = InterpolationContext.from_densities(densities)
+    assert _interpolate_row_index(ctx) == [[1.0], [0.0]]
+    fig = ridgeplot(densities=densities, colormode="row-index")
+    assert len(fig.data) == 4
+
+
+def test_interpolation_context_eq_and_hash() -> None:
+    densities = [[[(0, 1), (1, 2), (2, 1)]]]
+    ctx = InterpolationContext.from_densities(densities)
+    other = InterpolationContext.from_densities(densities)
+    assert ctx == ctx  # noqa: PLR0124
+    assert ctx != other
+    assert len({ctx, other}) == 2
+
+
+@pytest.mark.parametrize("colormode", ["mean-minmax", "mean-means", "fillgradient"])
+def test_mean_based_colormodes_fail_for_zero_mass_trace(
+    colormode: Literal["fillgradient"] | SolidColormode,
+) -> None:
+    densities = [[[(0, 0), (1, 0), (2, 0)]], [[(0, 1), (1, 2), (2, 1)]]]
+    with pytest.raises(ValueError, match=r"y-values sum to zero \(trace index: 0\)"):
+        ridgeplot(densities=densities, colormode=colormode)
+
+
 _DENSITY_01 = [(0, 1), (1, 2), (2, 1)]
 _DENSITY_02 = [(1, 1), (2, 2), (3, 1)]
 
@@ -22,15 +22,11 @@ def bar_trace() -> BarTrace:
 
 @pytest.fixture
 def interpolation_ctx() -> InterpolationContext:
-    return InterpolationContext(
-        densities=[
+    return InterpolationContext.from_densities(
+        [
             [[(0, 0), (1, 1), (2, 0)]],
             [[(1, 0), (2, 1), (3, 0)]],
-        ],
-        n_rows=2,
-        n_traces=2,
-        x_min=0,
-        x_max=3,
+        ]
     )
 
 
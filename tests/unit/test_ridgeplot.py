@@ -84,6 +84,11 @@ def test_unknown_trace_type() -> None:
         ridgeplot(samples=[[1, 2, 3], [1, 2, 3]], trace_type="foo")  # pyright: ignore[reportArgumentType]
 
 
+def test_unknown_colormode() -> None:
+    with pytest.raises(ValueError, match="Invalid colormode 'foo'"):
+        ridgeplot(samples=[[1, 2, 3], [1, 2, 3]], colormode="foo")  # pyright: ignore[reportArgumentType]
+
+
 # ==============================================================
 # ---  param: nbins
 # ==============================================================
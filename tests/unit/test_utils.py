@@ -1,94 +1,9 @@
 from __future__ import annotations
 
-from itertools import product
-from typing import TYPE_CHECKING, TypeVar
-
 import numpy as np
 import pytest
 
-from ridgeplot._utils import get_xy_extrema, normalise_min_max
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
-    from ridgeplot._types import Densities, DensitiesRow
-
-_X = TypeVar("_X")
-
-
-def id_func(x: _X) -> _X:
-    """Identity function."""
-    return x
-
-
-class TestGetXYExtrema:
-    """Tests for the :func:`ridgeplot._utils.get_xy_extrema` function"""
-
-    def test_raise_for_empty_sequence(self) -> None:
-        # Fails for empty sequence
-        with pytest.raises(ValueError, match="The densities array should not be empty"):
-            get_xy_extrema(densities=[])
-
-    def test_raise_for_non_2d_array(self) -> None:
-        # Fails if one of the arrays is not 2D
-        with pytest.raises(ValueError, match=r"too many values to unpack \(expected 2\)"):
-            get_xy_extrema(
-                densities=[
-                    # valid 2D trace
-                    [[(0, 0), (1, 1), (2, 2)]],
-                    # invalid 3D trace
-                    [[(3, 3, 3), (4, 4, 4)]],  # pyright: ignore[reportArgumentType]
-                ]
-            )
-
-    @pytest.mark.parametrize(
-        ("densities_type", "rows_type"),
-        product((id_func, tuple, list), (id_func, tuple, list, np.asarray)),
-    )
-    def test_expected_output(
-        self,
-        densities_type: Callable[[Densities], Densities],
-        rows_type: Callable[[DensitiesRow], DensitiesRow],
-    ) -> None:
-        """Test :func:`get_xy_extrema()` against a varied combination of
-        possible input types."""
-        # This list contains a varied set of collection types.
-        # Which is to show that `get_xy_extrema` accepts any
-        # iterable of a valid `Densities` object
-        densities: Densities = [
-            (
-                [
-                    (1, 1),  # x_min -> 1
-                    (2, 2),
-                    (3, 3),
-                    (4, 4),
-                ],
-            ),
-            [
-                (
-                    (2, 2),
-                    (36, 3),  # x_max -> 36
-                    (4, 62),  # y_max -> 62
-                )
-            ],
-            np.asarray(
-                [
-                    [
-                        (2, 0),  # y_min -> 0
-                        (3, 1),
-                    ]
-                ]
-            ),
-        ]
-        densities = densities_type([rows_type(row) for row in densities])
-        # The x-y extrema of the densities array above are:
-        expected = (
-            1,  # x_min
-            36,  # x_max
-            0,  # y_min
-            62,  # y_max
-        )
-        assert get_xy_extrema(densities) == expected
+from ridgeplot._utils import normalise_min_max, normalise_min_max_array
 
 
 class TestNormaliseMinMax:
@@ -130,3 +45,26 @@ class TestNormaliseMinMax:
         """Test :func:`normalise_min_max()` against some simple examples."""
         assert normalise_min_max(val=24, min_=12, max_=36) == 0.5
         assert normalise_min_max(val=6, min_=4, max_=24) == 0.1
+
+    @pytest.mark.parametrize("val", [float("nan"), np.nan])
+    def test_raises_for_nan(self, val: float) -> None:
+        """NaN values are never within bounds."""
+        with pytest.raises(ValueError, match=r"val \(nan\) is out of bounds \(0, 2\)"):
+            normalise_min_max(val=val, min_=0, max_=2)
+        with pytest.raises(ValueError, match=r"val \(nan\) is out of bounds \(0, 2\)"):
+            normalise_min_max_array(np.array([1.0, val]), min_=0, max_=2)
+
+    def test_array_raises_for_invalid_range(self) -> None:
+        """Assert :func:`normalise_min_max_array()` fails just like
+        :func:`normalise_min_max()`."""
+        with pytest.raises(ValueError, match=r"max_ should be greater than min_"):
+            normalise_min_max_array(np.array([0.0]), min_=3.0, max_=3.0)
+        with pytest.raises(ValueError, match=r"val \(5\.0\) is out of bounds \(2\.0, 3\.0\)"):
+            normalise_min_max_array(np.array([2.5, 5.0]), min_=2.0, max_=3.0)
+
+    def test_array_matches_scalar(self) -> None:
+        """The output of :func:`normalise_min_max_array()` should be equal to
+        calling :func:`normalise_min_max()` on each value."""
+        values = np.array([4, 6, 12.5, 24])
+        expected = [normalise_min_max(val=val, min_=4, max_=24) for val in values]
+        assert normalise_min_max_array(values, min_=4, max_=24).tolist() == expected